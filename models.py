@@ -1,9 +1,58 @@
 import random
 import time
-from math import log10
+from collections import deque
 import pygame as pg
 import numpy as np
 
+NEIGHBOURS_OFFSETS = ((-1, -1), (-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1), (0, -1))
+DIGIT_COLORS = (  # color of the number of bombs around a cell, indexed by that number
+    None, (0, 1, 253), (1, 126, 0), (254, 0, 1), (1, 0, 130), (127, 2, 1), (0, 128, 128), (0, 0, 0), (100, 100, 100)
+)
+
+
+def flood_discover(grid: np.ndarray, counts: np.ndarray, start_row: int, start_col: int) -> list[tuple[int, int]]:
+    """
+    Discovers a non-bomb cell and all its neighbours until a bomb is near, using a scan-line flood fill: each run of
+    empty cells is discovered as a whole row segment, and only the rows above and below are scanned for new runs.
+    Works on the raw arrays so that the hot loop does not go through attribute lookups.
+    :param grid: grid of the game, modified in place
+    :param counts: number of bombs next to each cell
+    :param start_row: row of the cell to discover
+    :param start_col: column of the cell to discover
+    :return: the coordinates of the discovered cells
+    """
+    height, width = grid.shape
+    discovered = []
+    seeds = deque([(start_row, start_col)])
+    while seeds:
+        row, col = seeds.popleft()
+        if grid[row, col] != -1:  # flagged or already discovered
+            continue
+        if counts[row, col] != 0:
+            grid[row, col] = counts[row, col]
+            discovered.append((row, col))
+            continue
+        left, right = col, col  # extends the run of empty cells as far as possible on the row
+        while left > 0 and grid[row, left - 1] == -1 and counts[row, left - 1] == 0:
+            left -= 1
+        while right < width - 1 and grid[row, right + 1] == -1 and counts[row, right + 1] == 0:
+            right += 1
+        first, last = max(0, left - 1), min(width, right + 2)  # the run and its two borders
+        for scanned_row in range(max(0, row - 1), min(height, row + 2)):
+            segment = grid[scanned_row, first:last]
+            segment_counts = counts[scanned_row, first:last]
+            undiscovered = segment == -1
+            if scanned_row == row:
+                to_discover = undiscovered
+            else:  # empty cells of the other rows are discovered later as the seeds of their own runs
+                empty = undiscovered & (segment_counts == 0)
+                to_discover = undiscovered & ~empty
+                run_starts = np.flatnonzero(empty & ~np.concatenate(([False], empty[:-1])))
+                seeds.extend((scanned_row, first + int(start)) for start in run_starts)
+            segment[to_discover] = segment_counts[to_discover]
+            discovered.extend((scanned_row, first + int(offset)) for offset in np.flatnonzero(to_discover))
+    return discovered
+
 
 class Grid:
     def __init__(self, grid_height: int = 0, grid_width: int = 0, bombs_nb: int = 0) -> None:
@@ -11,10 +60,15 @@ class Grid:
             self.grid_height = grid_height
             self.grid_width = grid_width
             self.bombs_nb = bombs_nb
-            self.bombs = []
+            self.bombs = frozenset()
+            self.bomb_mask = np.zeros([self.grid_height, self.grid_width], dtype=bool)
             self.place_bombs()
-            self.grid = np.full([self.grid_height, self.grid_width], -1, dtype=int)
+            self.counts = self.count_neighbour_bombs()
+            self.grid = np.full([self.grid_height, self.grid_width], -1, dtype=np.int8)
             self.game_status = 0  # -1: player lost, 0: still playing, 1: player won
+            self.dirty = []  # cells changed since the last time the grid was drawn
+            self.undiscovered_cells_nb = self.grid_height * self.grid_width  # flagged cells are undiscovered too
+            self.flags_nb = 0
         else:
             self.grid = []
 
@@ -40,12 +94,22 @@ class Grid:
         """
         Picks random cells where there will be bombs
         """
-        placed_bombs = 0
-        while placed_bombs < self.bombs_nb:
-            random_cell = (random.randrange(self.grid_height), random.randrange(self.grid_width))
-            if random_cell not in self.bombs:
-                self.bombs.append(random_cell)
-                placed_bombs += 1
+        flat = np.array(random.sample(range(self.grid_height * self.grid_width), self.bombs_nb), dtype=np.intp)
+        rows, cols = np.unravel_index(flat, (self.grid_height, self.grid_width))
+        self.bombs = frozenset(zip(rows.tolist(), cols.tolist()))
+        self.bomb_mask[rows, cols] = True
+
+    def count_neighbour_bombs(self) -> np.ndarray:
+        """
+        Counts the bombs around every cell at once, by summing the padded bomb mask shifted towards each neighbour
+        :return: array of the grid shape with the number of bombs next to each cell
+        """
+        padded_mask = np.pad(self.bomb_mask, 1).astype(np.uint8)
+        counts = np.zeros([self.grid_height, self.grid_width], dtype=np.uint8)
+        for row_offset, col_offset in NEIGHBOURS_OFFSETS:
+            counts += padded_mask[1 + row_offset:1 + row_offset + self.grid_height,
+                                  1 + col_offset:1 + col_offset + self.grid_width]
+        return counts
 
     def get_neighbours(self, cell_coordinates):
         """
@@ -53,21 +117,9 @@ class Grid:
         :param cell_coordinates: coordinates of the cell from which we want the neighbours
         :return: the list of neighbours
         """
-        row = cell_coordinates[0]
-        col = cell_coordinates[1]
-        neighbours = [
-            (row - 1, col - 1),
-            (row - 1, col),
-            (row - 1, col + 1),
-            (row, col + 1),
-            (row + 1, col + 1),
-            (row + 1, col),
-            (row + 1, col - 1),
-            (row, col - 1)
-        ]
-        in_grid_neighbours = [cell for cell in neighbours if
-                              0 <= cell[0] < self.grid_height and 0 <= cell[1] < self.grid_width]
-        return in_grid_neighbours
+        row, col = cell_coordinates
+        return [(row + row_offset, col + col_offset) for row_offset, col_offset in NEIGHBOURS_OFFSETS
+                if 0 <= row + row_offset < self.grid_height and 0 <= col + col_offset < self.grid_width]
 
     def check_for_bombs(self, cell_coordinates: tuple[int]) -> int:
         """
@@ -75,33 +127,26 @@ class Grid:
         :param cell_coordinates: coordinates of the cell we want to check as (row, col)
         :return: 9 if the cell is a bomb, the number of bombs in the neighbours otherwise
         """
-        if cell_coordinates in self.bombs:
+        if self.bomb_mask[cell_coordinates]:
             return 9
-        near_bombs = 0
-        neighbours = self.get_neighbours(cell_coordinates)
-        for cell in neighbours:
-            if cell in self.bombs:
-                near_bombs += 1
-        return near_bombs
+        return int(self.counts[cell_coordinates])
 
     def discover_cell(self, cell_coordinates: tuple[int]) -> None:
         """
-        Discovers a cell and all its neighbours until a bomb is near$
+        Discovers a cell and all its neighbours until a bomb is near
         :param cell_coordinates: coordinates of the cell we want to check as (row, col)
         """
         if self.grid[cell_coordinates] == -2:  # cannot discover a flagged cell
             return
-        current_cell_bombs = self.check_for_bombs(cell_coordinates)
-        self.grid[cell_coordinates] = current_cell_bombs
-        if current_cell_bombs == 9:
+        if self.check_for_bombs(cell_coordinates) == 9:
             self.discover_all_non_flagged_bombs()
             self.grid[cell_coordinates] = 10  # indicates the bomb that made the player loose
+            self.dirty.append(cell_coordinates)
             self.game_status = -1
-        if current_cell_bombs == 0:  # if there are no bombs near, discovers all its neighbours
-            neighbours = self.get_neighbours(cell_coordinates)
-            undiscovered_neighbours = [neighbour for neighbour in neighbours if self.grid[neighbour] == -1]
-            for neighbour in undiscovered_neighbours:
-                self.discover_cell(neighbour)
+            return
+        discovered_cells = flood_discover(self.grid, self.counts, *cell_coordinates)
+        self.undiscovered_cells_nb -= len(discovered_cells)
+        self.dirty.extend(discovered_cells)
         self.update_game_status()
 
     def discover_all_non_flagged_bombs(self) -> None:
@@ -109,25 +154,24 @@ class Grid:
         Discovers all bombs in the grid except the one that was already discovered, the one that made the player loose,
         which has to display in red
         """
-        for i in range(0, self.grid_height):
-            for j in range(0, self.grid_width):
-                if (i, j) in self.bombs:
-                    if self.grid[i, j] != -2:  # we don't display a bomb on a flagged cell
-                        self.grid[i, j] = 9
-                elif self.grid[i, j] == -2:  # if we flagged a bomb
-                    self.grid[i, j] = -3  # -3 means no bomb but flagged
+        flagged = self.grid == -2
+        wrongly_flagged = ~self.bomb_mask & flagged
+        self.grid[self.bomb_mask & ~flagged] = 9  # we don't display a bomb on a flagged cell
+        self.grid[wrongly_flagged] = -3  # -3 means no bomb but flagged
+        self.flags_nb -= int(np.count_nonzero(wrongly_flagged))
+        self.dirty.extend(zip(*np.nonzero(self.bomb_mask ^ flagged)))
 
     def get_remaining_non_flagged_bombs_nb(self):
-        flags = self.grid == -2
-        return max(0, self.bombs_nb - np.count_nonzero(flags))
+        return max(0, self.bombs_nb - self.flags_nb)
 
     def flag_non_flagged_bombs(self) -> None:
         """
         Flags all non-flagged bombs
         """
-        for bomb in self.bombs:
-            if self.grid[bomb] == -1:
-                self.grid[bomb] = -2
+        non_flagged_bombs = self.bomb_mask & (self.grid == -1)
+        self.grid[non_flagged_bombs] = -2
+        self.flags_nb += int(np.count_nonzero(non_flagged_bombs))
+        self.dirty.extend(zip(*np.nonzero(non_flagged_bombs)))
 
     def flag_cell(self, cell_coordinates: tuple[int]) -> bool:
         """
@@ -137,19 +181,22 @@ class Grid:
         """
         if self.grid[cell_coordinates] == -1:
             self.grid[cell_coordinates] = -2
+            self.flags_nb += 1
+            self.dirty.append(cell_coordinates)
             return True
         if self.grid[cell_coordinates] == -2:
             self.grid[cell_coordinates] = -1
+            self.flags_nb -= 1
+            self.dirty.append(cell_coordinates)
             return True
         return False
 
     def update_game_status(self) -> bool:
         """
-        Counts the remaining undiscovered cells and compares it to the number of bombs
+        Compares the number of remaining undiscovered cells to the number of bombs
         :return: True if the player discovered all the non-bombs cells, False otherwise
         """
-        non_discovered_cells = self.grid < 0  # -1 for non-flagged bombs, -2 for flagged bombs
-        if np.count_nonzero(non_discovered_cells) == self.bombs_nb:
+        if self.undiscovered_cells_nb == self.bombs_nb:
             self.game_status = 1
             self.flag_non_flagged_bombs()
 
@@ -170,6 +217,8 @@ class Timer:
 
 
 class Game:
+    font_cache: dict[tuple[str, int], pg.font.Font] = {}
+
     def __init__(self):
         pg.init()
         self.difficulty = 0
@@ -178,12 +227,28 @@ class Game:
         self.bombs_nb = 0
         self.screen = None
         self.grid = None
-        self.flag_img = pg.image.load("assets/flag.png")
-        self.bomb_img = pg.image.load("assets/bomb.png")
-        self.no_bomb_img = pg.image.load("assets/no_bomb.png")
+        self.flag_img = None
+        self.bomb_img = None
+        self.no_bomb_img = None
+        self.digit_imgs = {value: self.render_digit(value) for value in range(1, 9)}
+        self.cell_imgs = None
         self.timer = None
+        self.buttons_rects = None
+        self.drawn_time = None  # time currently displayed by the timer, None if it has to be drawn again
         self.buttons = None
 
+    def get_font(self, font: str, font_size: int) -> pg.font.Font:
+        """
+        Gives the font of the given name and size, only creating it the first time as SysFont is slow
+        :param font: name of the font
+        :param font_size: size of the font
+        :return: the pygame font
+        """
+        key = (font, font_size)
+        if key not in self.font_cache:
+            self.font_cache[key] = pg.font.SysFont(font, font_size)
+        return self.font_cache[key]
+
     def draw_text(self, text: str, font_size: int, color: tuple[int], y: int, x: int = None, font: str = 'gothambold') -> None:
         """
         Draws a string on the current pygame screen. If x is not specified, the text is horizontally centered.
@@ -194,13 +259,14 @@ class Game:
         :param x: x position (optional)
         :param font: font of the text
         """
-        font = pg.font.SysFont(font, font_size)
+        font = self.get_font(font, font_size)
         t = font.render(text, True, color)
         if x is None:
-            x = pg.display.get_surface().get_size()[0] // 2 - t.get_width() // 2
+            x = self.screen.get_width() // 2 - t.get_width() // 2
         self.screen.blit(t, (x, y))
 
-    def draw_rect(self, height: int, width: int, gray_level: int, y: int, x: int = None, border_width: int = 2) -> None:
+    def draw_rect(self, height: int, width: int, gray_level: int, y: int, x: int = None, border_width: int = 2,
+                  surface: pg.Surface = None) -> None:
         """
         Draws a rectangle on the current pygame screen. If x is not specified, the text is horizontally centered.
         :param height: height of the rectangle
@@ -209,9 +275,12 @@ class Game:
         :param y: y position
         :param x: x position (optional)
         :param border_width: width of the border of the rectangle
+        :param surface: surface to draw on instead of the screen (optional)
         """
+        if surface is None:
+            surface = self.screen
         if x is None:
-            x = pg.display.get_surface().get_size()[0] // 2 - width // 2
+            x = surface.get_width() // 2 - width // 2
         main_color = tuple(gray_level for _ in range(0, 3))
         high_color = tuple(min(gray_level + 50, 255) for _ in range(0, 3))
         low_color = tuple(max(gray_level - 50, 0) for _ in range(0, 3))
@@ -220,11 +289,11 @@ class Game:
         bottom_y = y + height - h_b_w - 1
         left_x = x + h_b_w - 1
         right_x = x + width - h_b_w - 1
-        pg.draw.rect(self.screen, main_color, pg.Rect(x, y, width, height))
-        pg.draw.line(self.screen, high_color, (x, top_y), (right_x, top_y), border_width)
-        pg.draw.line(self.screen, high_color, (left_x, y), (left_x, bottom_y), border_width)
-        pg.draw.line(self.screen, low_color, (right_x, bottom_y), (right_x, y), border_width)
-        pg.draw.line(self.screen, low_color, (right_x + h_b_w, bottom_y), (x, bottom_y), border_width)
+        pg.draw.rect(surface, main_color, pg.Rect(x, y, width, height))
+        pg.draw.line(surface, high_color, (x, top_y), (right_x, top_y), border_width)
+        pg.draw.line(surface, high_color, (left_x, y), (left_x, bottom_y), border_width)
+        pg.draw.line(surface, low_color, (right_x, bottom_y), (right_x, y), border_width)
+        pg.draw.line(surface, low_color, (right_x + h_b_w, bottom_y), (x, bottom_y), border_width)
 
     def draw_button(self, text: str, height: int, width: int, gray_level: int, y: int, x: int = None) -> None:
         """
@@ -240,78 +309,111 @@ class Game:
         self.draw_rect(height, width, gray_level, y, x)
         self.draw_text(text, height // 2, (0, 0, 0), y + height // 4, x)
 
-    def draw_undiscovered_cell(self, y: int, x: int, flagged: bool = False) -> None:
+    def draw_undiscovered_cell(self, y: int, x: int, flagged: bool = False, surface: pg.Surface = None) -> None:
         """
         Draws an undiscovered cell, which is a rectangle. Puts a flag image on it if flagged.
         :param y: y position
         :param x: x position
         :param flagged: True if the cell is flagged, False otherwise
+        :param surface: surface to draw on instead of the screen (optional)
         """
-        self.draw_rect(20, 20, 170, y, x, 2)
+        if surface is None:
+            surface = self.screen
+        self.draw_rect(20, 20, 170, y, x, 2, surface)
         if flagged:
-            self.screen.blit(self.flag_img, (x + 1, y + 1))
+            surface.blit(self.flag_img, (x + 1, y + 1))
 
-    def draw_discovered_cell(self, y: int, x: int, value: int) -> None:
+    def render_digit(self, value: int) -> pg.Surface:
+        """
+        Renders the number of bombs around a cell in its color, to be blitted on discovered cells
+        :param value: number of bombs around the cell (1-8)
+        :return: the rendered number
+        """
+        return self.get_font('gothambold', 16).render(str(value), True, DIGIT_COLORS[value])
+
+    def draw_discovered_cell(self, y: int, x: int, value: int, surface: pg.Surface = None) -> None:
         """
         Draws a discovered cell, with the number of bombs around it (blank if 0), a bomb if it's a bomb cell
         :param y: y position
         :param x: x position
         :param value: value of the cell (0-10)
+        :param surface: surface to draw on instead of the screen (optional)
         """
-        self.draw_rect(20, 20, 80, y, x, 0)
-        self.draw_rect(19, 19, 130, y + 1, x + 1, 0)
+        if surface is None:
+            surface = self.screen
+        self.draw_rect(20, 20, 80, y, x, 0, surface)
+        self.draw_rect(19, 19, 130, y + 1, x + 1, 0, surface)
         if value == 10:
-            pg.draw.rect(self.screen, (200, 0, 0), pg.Rect(x + 1, y + 1, 18, 18))
+            pg.draw.rect(surface, (200, 0, 0), pg.Rect(x + 1, y + 1, 18, 18))
         if value == 9 or value == 10:
-            self.screen.blit(self.bomb_img, (x + 1, y + 1))
+            surface.blit(self.bomb_img, (x + 1, y + 1))
         elif value == -3:
-            self.screen.blit(self.no_bomb_img, (x + 1, y + 1))
+            surface.blit(self.no_bomb_img, (x + 1, y + 1))
         elif value != 0:
-            color = (0, 0, 0)
-            match value:
-                case 1:
-                    color = (0, 1, 253)
-                case 2:
-                    color = (1, 126, 0)
-                case 3:
-                    color = (254, 0, 1)
-                case 4:
-                    color = (1, 0, 130)
-                case 5:
-                    color = (127, 2, 1)
-                case 6:
-                    color = (0, 128, 128)
-                case 7:
-                    color = (0, 0, 0)
-                case 8:
-                    color = (100, 100, 100)
-            self.draw_text(str(value), 16, color, y + 3, x + 5)
+            surface.blit(self.digit_imgs[value], (x + 5, y + 3))
+
+    def load_images(self) -> None:
+        """
+        Loads the images of the cells, converted to the pixel format of the display so that blitting them does not
+        convert them each time. Has to be called after the display mode is set.
+        """
+        self.flag_img = pg.image.load("assets/flag.png").convert_alpha()
+        self.bomb_img = pg.image.load("assets/bomb.png").convert_alpha()
+        self.no_bomb_img = pg.image.load("assets/no_bomb.png").convert_alpha()
+
+    def render_cells(self) -> None:
+        """
+        Renders every possible cell once (-3 to 10), so that drawing a cell is a single blit instead of rectangles,
+        lines and images. Has to be called after the display mode is set.
+        """
+        self.cell_imgs = {}
+        for value in range(-3, 11):
+            cell_img = pg.Surface((20, 20)).convert()
+            if -3 < value < 0:
+                self.draw_undiscovered_cell(0, 0, value == -2, cell_img)
+            else:
+                self.draw_discovered_cell(0, 0, value, cell_img)
+            self.cell_imgs[value] = cell_img
 
     def draw_grid(self):
         """
         Draws the game grid on the current screen
         """
         self.draw_rect(self.grid_height * 20 + 4, self.grid_width * 20 + 4, 170, 68, 18)
-        for i in range(0, self.grid_height):
-            for j in range(0, self.grid_width):
-                if -3 < self.grid.grid[i, j] < 0:
-                    self.draw_undiscovered_cell(70 + 20 * i, 20 + 20 * j, self.grid.grid[i, j] == -2)
-                else:
-                    self.draw_discovered_cell(70 + 20 * i, 20 + 20 * j, self.grid.grid[i, j])
+        for value, cell_img in self.cell_imgs.items():  # groups the cells by value instead of branching on each one
+            cells = np.argwhere(self.grid.grid == value).tolist()
+            self.screen.blits([(cell_img, (20 + 20 * j, 70 + 20 * i)) for i, j in cells], doreturn=False)
+        self.grid.dirty.clear()
+
+    def draw_cell(self, i: int, j: int) -> pg.Rect:
+        """
+        Draws a cell of the grid according to its value
+        :param i: row of the cell
+        :param j: column of the cell
+        :return: the area of the screen covered by the cell
+        """
+        return self.screen.blit(self.cell_imgs[self.grid.grid[i, j]], (20 + 20 * j, 70 + 20 * i))
+
+    def draw_dirty_cells(self) -> None:
+        """
+        Draws only the cells that changed since the grid was last drawn, and updates their area of the display
+        """
+        pg.display.update([self.draw_cell(i, j) for i, j in self.grid.dirty])
+        self.grid.dirty.clear()
 
     def draw_timer(self, y: int, x: int) -> None:
         """
-        Draws the timer of the game
+        Draws the timer of the game, only when the displayed second has changed
         :param y: y position
         :param x: x position
         """
         self.timer.update()
         current_time = self.timer.time
-        if current_time > 99:
-            width = 35 + 15 * int(log10(current_time))
-        else:
-            width = 65
-        text = '00' + str(current_time) if current_time < 10 else ('0' + str(current_time) if current_time < 100 else str(current_time))
+        if current_time == self.drawn_time:
+            return
+        self.drawn_time = current_time
+        text = f'{current_time:03}'
+        width = 35 + 15 * (len(text) - 1)  # 15 more pixels per digit after the third one
         self.draw_rect(40, width, 10, y, x, 0)
         self.draw_text(text, 44, (200, 0, 0), y + 7, x + 5, 'arialbold')
 
@@ -332,6 +434,7 @@ class Game:
         :param game_status: -1: player lost, 0: currently playing, 1: player won
         """
         self.draw_rect(54, self.grid_width * 20 + 4, 190, 8, 18, 2)
+        self.drawn_time = None  # the timer has just been covered
         if self.timer:
             self.draw_timer(15, 25)
         if self.grid:
@@ -347,6 +450,17 @@ class Game:
         """
         [self.draw_button(btn[1], btn[2], btn[3], 170, btn[4]) for btn in self.buttons]
 
+    def get_button_at(self, pos: tuple[int]) -> list | None:
+        """
+        Gives the menu button at a position of the screen
+        :param pos: position as (x, y)
+        :return: the button at this position, None if there is none
+        """
+        for btn, rect in zip(self.buttons, self.buttons_rects):
+            if rect.collidepoint(pos):
+                return btn
+        return None
+
     def start(self):
         """
         Starts the game by displaying the menu
@@ -361,12 +475,15 @@ class Game:
         self.screen = pg.display.set_mode((400, 400))
         pg.display.set_caption('Minesweeper - Menu')
         self.screen.fill((200, 200, 200))
-        self.buttons = [  # [action, value, text, height, width, y]
+        self.buttons = [  # [action, text, height, width, y]
             [0, "Beginner", 50, 200, 130],
             [1, "Intermediate", 50, 200, 200],
             [2, "Expert", 50, 200, 270],
             [-1, "Quit", 30, 130, 340]
         ]
+        self.buttons_rects = [
+            pg.Rect((self.screen.get_width() - btn[3]) // 2, btn[4], btn[3], btn[2]) for btn in self.buttons
+        ]
         self.draw_buttons()
         pg.display.update()
 
@@ -374,26 +491,23 @@ class Game:
         """
         Menu of the game, where the player chooses the difficulty of the game
         """
-        screen_width = pg.display.get_surface().get_size()[0]
+        hovered_button = None
         while True:
-            for event in pg.event.get():
+            for event in [pg.event.wait()] + pg.event.get():  # nothing moves in the menu, so we sleep until an event
                 if event.type == pg.QUIT:
                     exit()
-                elif event.type == pg.MOUSEMOTION or event.type == pg.MOUSEBUTTONDOWN:
-                    self.draw_buttons()
-                    mouse_pos = pg.mouse.get_pos()
-                    x = mouse_pos[0]
-                    y = mouse_pos[1]
-                    clicked_button = None
-                    for btn in self.buttons:
-                        if 0 <= x - (screen_width - btn[3]) // 2 <= btn[3] and 0 <= y - btn[4] <= btn[2]:
-                            if event.type == pg.MOUSEMOTION:
-                                self.draw_button(btn[1], btn[2], btn[3], 120, btn[4])
-                            else:
-                                self.draw_button(btn[1], btn[2], btn[3], 80, btn[4])
-                                clicked_button = btn
-                            break
+                elif event.type == pg.MOUSEMOTION:
+                    button = self.get_button_at(event.pos)
+                    if button is not hovered_button:  # the buttons only change when the hovered one does
+                        self.draw_buttons()
+                        if button:
+                            self.draw_button(button[1], button[2], button[3], 120, button[4])
+                        pg.display.update(self.buttons_rects)
+                        hovered_button = button
+                elif event.type == pg.MOUSEBUTTONDOWN:
+                    clicked_button = self.get_button_at(event.pos)
                     if clicked_button:
+                        self.draw_button(clicked_button[1], clicked_button[2], clicked_button[3], 80, clicked_button[4])
                         if clicked_button[0] >= 0:
                             self.difficulty = clicked_button[0]
                             if self.difficulty == 0:
@@ -407,7 +521,6 @@ class Game:
                             break
                         else:
                             exit()
-                    pg.display.update()
             else:
                 continue
             break
@@ -417,11 +530,13 @@ class Game:
         """
         Displays the components of the game and creates a new screen instance
         """
-        screen = pg.display.set_mode((self.grid_width * 20 + 40, self.grid_height * 20 + 40 + 50))
+        self.screen = pg.display.set_mode((self.grid_width * 20 + 40, self.grid_height * 20 + 40 + 50))
         pg.display.set_caption(
             f'Minesweeper - {"Beginner" if self.difficulty == 0 else "Intermediate" if self.difficulty == 1 else "Expert"}'
         )
-        screen.fill((200, 200, 200))
+        self.screen.fill((200, 200, 200))
+        self.load_images()
+        self.render_cells()
         self.draw_grid()
         self.draw_info_bar()
         pg.display.update()
@@ -431,9 +546,14 @@ class Game:
         Main game loop
         """
         self.timer = Timer()
+        info_bar_rect = pg.Rect(18, 8, self.grid_width * 20 + 4, 54)
+        clock = pg.time.Clock()
         while True:
             if self.grid.game_status == 0:
+                drawn_time = self.drawn_time
                 self.draw_timer(15, 25)
+                if self.drawn_time != drawn_time:
+                    pg.display.update(info_bar_rect)
             for event in pg.event.get():
                 if event.type == pg.QUIT or (event.type == pg.KEYDOWN and event.key == pg.K_ESCAPE):
                     exit()
@@ -454,8 +574,9 @@ class Game:
                         elif event.button == 3:  # right click
                             self.grid.flag_cell((cell_y, cell_x))
                             self.draw_remaining_non_flagged_bombs_nb(15, 20 + self.grid_width * 20 - 50)
-                        self.draw_grid()
+                            pg.display.update(info_bar_rect)
+                        self.draw_dirty_cells()
                     if self.grid.game_status != 0:
                         self.draw_info_bar(self.grid.game_status)
                         pg.display.update()
-            pg.display.update()
+            clock.tick(30)  # only the timer changes between events, no need to spin faster